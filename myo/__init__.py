@@ -24,6 +24,6 @@ __version__ = '1.0.5'
 __author__ = 'Niklas Rosenstein <rosensteinniklas@gmail.com>'
 
 from ._ffi import *
-from ._device_listener import DeviceListener, ApiDeviceListener
+from ._device_listener import DeviceListener, ApiDeviceListener, DeviceProxy
 
 supported_sdk_version = '0.9.0'
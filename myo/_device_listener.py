@@ -20,29 +20,47 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import array
+import logging
+import struct
 import threading
+import time
 import warnings
 from ._ffi import EventType, Pose, VibrationType
-from .utils import TimeoutManager
 from .math import Vector, Quaternion
 
+log = logging.getLogger(__name__)
+
+# Names of the #DeviceListener methods, indexed by #EventType value.
+_HANDLER_NAMES = tuple('on_' + x.name for x in EventType)
+
+# (listener class, event type) pairs that #DeviceListener.on_event() already
+# warned about.
+_unhandled_warned = set()
+
+# Writes the 8 EMG values of a sample into the ring buffer of a #DeviceProxy.
+_pack_emg_into = struct.Struct('8b').pack_into
+
 
 class DeviceListener(object):
   """
   Base class for device listeners -- objects that listen to Myo device events.
   """
 
+  __slots__ = ()
+
   def on_event(self, event):
-    if event.type.name:  # An event type that we know of.
-      attr = 'on_' + event.type.name
-      try:
-        method = getattr(self, attr)
-      except AttributeError:
-        pass
-      else:
-        return method(event)
-
-    warnings.warn('unhandled event: {}'.format(event))
+    type_ = event.type
+    method = getattr(self, _HANDLER_NAMES[type_], None)
+    if method is not None:
+      return method(event)
+
+    # Only warn once per listener class and event type, this would otherwise
+    # fire per event.
+    key = (type(self), type_)
+    if key not in _unhandled_warned:
+      _unhandled_warned.add(key)
+      warnings.warn('unhandled event: {}'.format(event))
     return True  # continue
 
   def on_paired(self, event): pass
@@ -66,8 +84,14 @@ class DeviceProxy(object):
   Stateful container for Myo device data.
   """
 
+  __slots__ = ('_device', '_mac_address', '_cond', '_pair_time',
+               '_unpair_time', '_connect_time', '_disconnect_time', '_emg',
+               '_orientation_update_index', '_imu', '_pose', '_arm_sync',
+               '_rssi', '_battery_level', '_firmware_version', '_name',
+               '_emg_ring', '_emg_timestamps', '_emg_head')
+
   def __init__(self, device, timestamp, firmware_version, mac_address,
-               condition_class=threading.Condition):
+               condition_class=threading.Condition, emg_buffer_size=512):
     self._device = device
     self._mac_address = mac_address
     self._cond = condition_class()
@@ -77,21 +101,27 @@ class DeviceProxy(object):
     self._disconnect_time = None
     self._emg = None
     self._orientation_update_index = 0
-    self._orientation = Quaternion.identity()
-    self._acceleration = Vector(0, 0, 0)
-    self._gyroscope = Vector(0, 0, 0)
+    # Values that are updated together are stored as tuples and replaced
+    # with a single assignment, so that readers always see a consistent set
+    # without locking: (orientation, acceleration, gyroscope) and
+    # (arm, x_direction).
+    self._imu = (Quaternion.identity(), Vector(0, 0, 0), Vector(0, 0, 0))
     self._pose = Pose.rest
-    self._arm = None
-    self._x_direction = None
+    self._arm_sync = (None, None)
     self._rssi = None
     self._battery_level = None
     self._firmware_version = firmware_version
     self._name = None
+    # Ring buffer of the last *emg_buffer_size* EMG samples, 8 values each.
+    # #_emg_head is the total number of samples that have been written. A
+    # size of zero disables the buffer.
+    self._emg_ring = array.array('b', [0]) * (8 * emg_buffer_size)
+    self._emg_timestamps = array.array('Q', [0]) * emg_buffer_size
+    self._emg_head = 0
 
   def __repr__(self):
-    with self._cond:
-      con = 'connected' if self._connected else 'disconnected'
-      return '<DeviceProxy ({}) name={!r}>'.format(con, self.name)
+    con = 'connected' if self._connected else 'disconnected'
+    return '<DeviceProxy ({}) name={!r}>'.format(con, self.name)
 
   @property
   def _connected(self):
@@ -99,13 +129,11 @@ class DeviceProxy(object):
 
   @property
   def connected(self):
-    with self._cond:
-      return self._connected
+    return self._connected
 
   @property
   def paired(self):
-    with self._cond:
-      return self._unpair_time is not None
+    return self._unpair_time is not None
 
   @property
   def mac_address(self):
@@ -117,8 +145,7 @@ class DeviceProxy(object):
 
   @property
   def unpair_time(self):
-    with self._cond:
-      return self._unpair_time
+    return self._unpair_time
 
   @property
   def connect_time(self):
@@ -126,8 +153,7 @@ class DeviceProxy(object):
 
   @property
   def disconnect_time(self):
-    with self._cond:
-      return self._disconnect_time
+    return self._disconnect_time
 
   @property
   def firmware_version(self):
@@ -135,48 +161,100 @@ class DeviceProxy(object):
 
   @property
   def orientation_update_index(self):
-    with self._cond:
-      return self._orientation_update_index
+    return self._orientation_update_index
 
   @property
   def orientation(self):
-    with self._cond:
-      return self._orientation.copy()
+    """
+    The latest orientation of the device. The returned #Quaternion is
+    replaced (not modified) on every update, so do not modify it in place.
+    """
+
+    return self._imu[0]
 
   @property
   def acceleration(self):
-    with self._cond:
-      return self._acceleration.copy()
+    """
+    The latest accelerometer reading of the device. The returned #Vector is
+    replaced (not modified) on every update, so do not modify it in place.
+    """
+
+    return self._imu[1]
 
   @property
   def gyroscope(self):
-    with self._cond:
-      return self._gyroscope.copy()
+    """
+    The latest gyroscope reading of the device. The returned #Vector is
+    replaced (not modified) on every update, so do not modify it in place.
+    """
+
+    return self._imu[2]
+
+  @property
+  def imu(self):
+    """
+    The latest `(orientation, acceleration, gyroscope)` of the device, all
+    from the same orientation event.
+    """
+
+    return self._imu
 
   @property
   def pose(self):
-    with self._cond:
-      return self._pose
+    return self._pose
 
   @property
   def arm(self):
-    with self._cond:
-      return self._arm
+    return self._arm_sync[0]
 
   @property
   def x_direction(self):
-    with self._cond:
-      return self._x_direction
+    return self._arm_sync[1]
 
   @property
   def rssi(self):
-    with self._cond:
-      return self._rssi
+    return self._rssi
 
   @property
   def emg(self):
-    with self._cond:
-      return self._emg
+    # Stored as the event's tuple, the list is only created when read.
+    emg = self._emg
+    return None if emg is None else list(emg)
+
+  def emg_window(self, n=None):
+    """
+    Returns the last *n* EMG samples that were received (or as many as were
+    kept, if *n* is #None or larger than the buffer) as a tuple of two
+    #array.array objects `(timestamps, emg)`, oldest first. The *emg* array
+    contains 8 values per sample.
+
+    Samples are written by the Hub's thread while this method copies them,
+    so a sample received during the call may already replace the oldest one
+    in the window.
+    """
+
+    size = len(self._emg_timestamps)
+    if size == 0:
+      return array.array('Q'), array.array('b')
+    head = self._emg_head
+    count = min(head, size) if n is None else max(0, min(n, head, size))
+    start = (head - count) % size
+    end = start + count
+    if end <= size:
+      timestamps = self._emg_timestamps[start:end]
+      emg = self._emg_ring[start * 8:end * 8]
+    else:
+      end -= size
+      timestamps = self._emg_timestamps[start:] + self._emg_timestamps[:end]
+      emg = self._emg_ring[start * 8:] + self._emg_ring[:end * 8]
+    return timestamps, emg
+
+  def _push_emg(self, timestamp, emg):
+    head = self._emg_head
+    index = head % len(self._emg_timestamps)
+    _pack_emg_into(self._emg_ring, index * 8, *emg)
+    self._emg_timestamps[index] = timestamp
+    self._emg_head = head + 1
 
   def set_locking_policy(self, policy):
     self._device.set_locking_policy(policy)
@@ -200,10 +278,15 @@ class DeviceProxy(object):
 
 class ApiDeviceListener(DeviceListener):
 
-  def __init__(self, condition_class=threading.Condition):
+  def __init__(self, condition_class=threading.Condition, emg_buffer_size=512):
+    if emg_buffer_size < 0:
+      raise ValueError('emg_buffer_size must not be negative')
     self._condition_class = condition_class
+    self._emg_buffer_size = emg_buffer_size
     self._cond = condition_class()
+    self._connected_event = threading.Event()
     self._devices = {}
+    self._connected_devices = {}  # Subset of #_devices that is connected.
 
   @property
   def devices(self):
@@ -212,8 +295,7 @@ class ApiDeviceListener(DeviceListener):
 
   @property
   def connected_devices(self):
-    with self._cond:
-      return [x for x in self._devices.values() if x.connected]
+    return list(self._connected_devices.values())
 
   def wait_for_single_device(self, timeout=None, interval=0.5):
     """
@@ -228,60 +310,102 @@ class ApiDeviceListener(DeviceListener):
       through a KeyboardInterrupt.
     """
 
-    timer = TimeoutManager(timeout)
-    with self._cond:
-      # As long as there are no Myo's connected, wait until we
-      # get notified about a change.
-      while not timer.check():
-        # Check if we found a Myo that is connected.
-        for device in self._devices.values():
-          if device.connected:
-            return device
-        self._cond.wait(timer.remainder(interval))
-
-    return None
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+      # Copying the values into a list is atomic, so we don't need the lock.
+      connected = list(self._connected_devices.values())
+      if connected:
+        return connected[0]
+      wait = interval
+      if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+          return None
+        if wait is None or remaining < wait:
+          wait = remaining
+      # Wait until a Myo connects. A connection that happens between the
+      # check above and clearing the event is picked up by the next check.
+      if self._connected_event.wait(wait):
+        self._connected_event.clear()
 
   def on_event(self, event):
-    with self._cond:
-      if event.type == EventType.paired:
-        device = DeviceProxy(event.device, event.timestamp,
-          event.firmware_version, self._condition_class)
+    # The listener lock is only taken when the device list changes. All
+    # other events are high-rate updates of an already known device, written
+    # by the Hub thread with plain attribute assignments. These are atomic
+    # under the GIL, so readers see either the old or the new value.
+    type_ = event.type
+    if type_ == EventType.paired:
+      device = DeviceProxy(event.device, event.timestamp,
+        event.firmware_version, event.mac_address, self._condition_class,
+        self._emg_buffer_size)
+      with self._cond:
         self._devices[device._device.handle] = device
-        self._cond.notify_all()
-        return
-      else:
-        try:
-          if event.type == EventType.unpaired:
-            device = self._devices.pop(event.device.handle)
-          else:
-            device = self._devices[event.device.handle]
-        except KeyError:
-          message = 'Myo device not in the device list ({})'
-          warnings.warn(message.format(event), RuntimeWarning)
-          return
-      if event.type == EventType.unpaired:
-        with device._cond:
+      return
+
+    if type_ == EventType.unpaired:
+      with self._cond:
+        device = self._devices.pop(event.device.handle, None)
+        self._connected_devices.pop(event.device.handle, None)
+        if device is not None:
           device._unpair_time = event.timestamp
-        self._cond.notify_all()
-
-    with device._cond:
-      if event.type == EventType.connected:
-        device._connect_time = event.timestamp
-      elif event.type == EventType.disconnected:
-        device._disconnect_time = event.timestamp
-      elif event.type == EventType.emg:
-        device._emg = event.emg
-      elif event.type == EventType.arm_synced:
-        device._arm = event.arm
-        device._x_direction = event.x_direction
-      elif event.type == EventType.rssi:
-        device._rssi = event.rssi
-      elif event.type == EventType.battery_level:
-        device._battery_level = event.battery_level
-      elif event.type == EventType.pose:
-        device._pose = event.pose
-      elif event.type == EventType.orientation:
-        device._orientation_update_index += 1
-        device._orientation = event.orientation
-        device._gyroscope = event.gyroscope
-        device._acceleration = event.acceleration
+    else:
+      device = self._devices.get(event.device.handle)
+
+    if device is None:
+      # Can happen for events that are still delivered for a device that was
+      # just unpaired. Not worth a warning (which is slow and would fire for
+      # every one of these events).
+      log.debug('Myo device not in the device list (%s)', event)
+      return
+
+    name = self._updater_names[type_]
+    if name is not None:
+      getattr(self, name)(device, event)
+
+  # Functions that apply an event to the #DeviceProxy it belongs to.
+
+  def _update_connected(self, device, event):
+    device._connect_time = event.timestamp
+    device._disconnect_time = None
+    self._connected_devices[device._device.handle] = device
+    self._connected_event.set()
+
+  def _update_disconnected(self, device, event):
+    device._disconnect_time = event.timestamp
+    self._connected_devices.pop(device._device.handle, None)
+
+  def _update_emg(self, device, event):
+    emg = event._read_emg()
+    device._emg = emg
+    if device._emg_timestamps:
+      device._push_emg(event.timestamp, emg)
+
+  def _update_arm_synced(self, device, event):
+    device._arm_sync = (event.arm, event.x_direction)
+
+  def _update_rssi(self, device, event):
+    device._rssi = event.rssi
+
+  def _update_battery_level(self, device, event):
+    device._battery_level = event.battery_level
+
+  def _update_pose(self, device, event):
+    device._pose = event.pose
+
+  def _update_orientation(self, device, event):
+    device._imu = event.imu
+    device._orientation_update_index += 1
+
+  # Names of the update methods indexed by #EventType value (which are dense),
+  # #None for events that don't update the device's state. They are looked up
+  # on the instance, so subclasses can override them.
+  _updater_names = tuple(map({
+    EventType.connected: '_update_connected',
+    EventType.disconnected: '_update_disconnected',
+    EventType.emg: '_update_emg',
+    EventType.arm_synced: '_update_arm_synced',
+    EventType.rssi: '_update_rssi',
+    EventType.battery_level: '_update_battery_level',
+    EventType.pose: '_update_pose',
+    EventType.orientation: '_update_orientation',
+  }.get, EventType))
@@ -20,23 +20,18 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import array
 import contextlib
-import cffi
+import operator
 import os
-import pkgutil
-import re
+import struct
 import threading
-import six
 import sys
+from enum import IntEnum
 
 from .macaddr import MacAddress
 from .math import Quaternion, Vector
 
-try:
-  from enum import IntEnum
-except:
-  from enum34 import IntEnum
-
 
 ##
 # Exceptions
@@ -55,11 +50,13 @@ class ResultError(Error):
   """
 
   def __init__(self, kind, message):
+    super(ResultError, self).__init__(kind, message)
     self.kind = kind
     self.message = message
+    self._string = str((kind, message))
 
   def __str__(self):
-    return str((self.kind, self.message))
+    return self._string
 
 
 class InvalidOperation(Error):
@@ -74,7 +71,6 @@ class InvalidOperation(Error):
 ##
 
 class Result(IntEnum):
-  __fallback__ = True
   success = 0
   error = 1
   error_invalid_argument = 2
@@ -82,20 +78,17 @@ class Result(IntEnum):
 
 
 class VibrationType(IntEnum):
-  __fallback__ = True
   short = 0
   medium = 1
   long = 2
 
 
 class StreamEmg(IntEnum):
-  __fallback__ = True
   disabled = 0
   enabled = 1
 
 
 class Pose(IntEnum):
-  __fallback__ = True
   rest = 0
   fist = 1
   wave_in = 2
@@ -108,7 +101,6 @@ Pose.num_poses = 6
 
 
 class EventType(IntEnum):
-  __fallback__ = True
   paired = 0
   unpaired = 1
   connected = 2
@@ -126,51 +118,43 @@ class EventType(IntEnum):
 
 
 class HandlerResult(IntEnum):
-  __fallback__ = True
   continue_ = 0
   stop = 1
 
 
 class LockingPolicy(IntEnum):
-  __fallback__ = True
   none = 0      #: Pose events are always sent.
   standard = 1  #: (default) Pose events are not sent while a Myo is locked.
 
 
 class Arm(IntEnum):
-  __fallback__ = True
   right = 0
   left = 1
   unknown = 2
 
 
 class XDirection(IntEnum):
-  __fallback__ = True
   toward_wrist = 0
   toward_elbow = 1
   unknown = 2
 
 
 class UnlockType(IntEnum):
-  __fallback__ = True
   timed = 0
   hold = 1
 
 
 class UserActionType(IntEnum):
-  __fallback__ = True
   single = 0
 
 
 class WarmupState(IntEnum):
-  __fallback__ = True
   unknown = 0
   cold = 1
   warm = 2
 
 
 class WarmupResult(IntEnum):
-  __fallback__ = True
   unknown = 0
   success = 1
   failed_timeout = 2
@@ -181,22 +165,51 @@ class WarmupResult(IntEnum):
 ##
 
 def _getffi():
-  string = pkgutil.get_data(__name__, 'libmyo.h').decode('utf8')
-  string = string.replace('\r\n', '\n')
-  # Remove stuff that cffi can not parse.
-  string = re.sub('^\s*#.*$', '', string, flags=re.M)
-  string = string.replace('LIBMYO_EXPORT', '')
-  string = string.replace('extern "C" {', '')
-  string = string.replace('} // extern "C"', '')
-
-  ffi = cffi.FFI()
-  ffi.cdef(string)
+  # Use the pre-parsed FFI generated by myo/_ffi_build.py if it's available,
+  # otherwise fall back to parsing the header at runtime.
+  try:
+    from ._libmyo_cffi import ffi
+  except ImportError:
+    from ._ffi_build import make_ffi
+    ffi = make_ffi()
   return ffi
 
 
 ffi = _getffi()
 libmyo = None
 
+# The C type of event handlers passed to libmyo_run().
+_handler_t = ffi.typeof('libmyo_handler_t')
+
+# libmyo functions that are called for (almost) every event. They are bound
+# to module-level names by #init() so that the event path does not need to
+# look them up on the #libmyo object every time.
+_event_get_type = None
+_event_get_timestamp = None
+_event_get_myo = None
+_event_get_mac_address = None
+_event_get_orientation = None
+_event_get_accelerometer = None
+_event_get_gyroscope = None
+_event_get_pose = None
+_event_get_emg = None
+
+
+def _bind_symbols(lib):
+  global _event_get_type, _event_get_timestamp, _event_get_myo
+  global _event_get_mac_address, _event_get_orientation
+  global _event_get_accelerometer, _event_get_gyroscope, _event_get_pose
+  global _event_get_emg
+  _event_get_type = lib.libmyo_event_get_type
+  _event_get_timestamp = lib.libmyo_event_get_timestamp
+  _event_get_myo = lib.libmyo_event_get_myo
+  _event_get_mac_address = lib.libmyo_event_get_mac_address
+  _event_get_orientation = lib.libmyo_event_get_orientation
+  _event_get_accelerometer = lib.libmyo_event_get_accelerometer
+  _event_get_gyroscope = lib.libmyo_event_get_gyroscope
+  _event_get_pose = lib.libmyo_event_get_pose
+  _event_get_emg = lib.libmyo_event_get_emg
+
 
 def _getdlname():
   arch = 32 if sys.maxsize <= 2 ** 32 else 64
@@ -236,10 +249,13 @@ def init(lib_name=None, bin_path=None, sdk_path=None):
 
   global libmyo
   libmyo = ffi.dlopen(lib_name)
+  _bind_symbols(libmyo)
 
 
 class _BaseWrapper(object):
 
+  __slots__ = ('_handle',)
+
   def __init__(self, handle):
     self._handle = handle
 
@@ -253,17 +269,33 @@ class ErrorDetails(_BaseWrapper):
   Wraps Myo error details information.
   """
 
+  __slots__ = ()
+
   def __init__(self):
     super(ErrorDetails, self).__init__(ffi.new('libmyo_hub_t*'))
 
   def __del__(self):
+    # The handle is not set if the constructor did not complete.
+    handle = getattr(self, '_handle', None)
+    if handle is not None and handle[0]:
+      libmyo.libmyo_free_error_details(handle[0])
+
+  def reset(self):
+    """
+    Frees the error details currently held by this object (if any) so that
+    it can be passed to another libmyo function call.
+    """
+
     if self._handle[0]:
       libmyo.libmyo_free_error_details(self._handle[0])
+      self._handle[0] = ffi.NULL
+    return self
 
   @property
   def kind(self):
     if self._handle[0]:
-      result = Result(libmyo.libmyo_error_kind(self._handle[0]))
+      result = _enum_lookup(_RESULTS, Result,
+          libmyo.libmyo_error_kind(self._handle[0]))
     else:
       result = Result.success
     return result
@@ -280,16 +312,140 @@ class ErrorDetails(_BaseWrapper):
     return self._handle
 
   def raise_for_kind(self):
-    kind = self.kind
-    if kind != Result.success:
-      raise ResultError(kind, self.message)
+    # libmyo only allocates error details on failure, the success path is
+    # just the NULL check.
+    if self._handle[0]:
+      kind = self.kind
+      if kind != Result.success:
+        raise ResultError(kind, self.message)
+
+
+_error_details_local = threading.local()
+
+
+def _error_details(error=None):
+  """
+  Returns *error* after resetting it. If *error* is #None, the #ErrorDetails
+  object of the calling thread is reset and returned instead, which is
+  allocated on the first call in every thread.
+
+  Note that the thread's #ErrorDetails object must not be used for calls
+  that can run other code before the error is checked (like `libmyo_run()`).
+  """
+
+  if error is None:
+    error = getattr(_error_details_local, 'error', None)
+    if error is None:
+      error = _error_details_local.error = ErrorDetails()
+      return error
+  return error.reset()
+
+
+# Plain integer event types to compare against on the hot path instead of
+# going through #EventType members.
+_ARM_SYNCED = int(EventType.arm_synced)
+_ORIENTATION = int(EventType.orientation)
+_POSE = int(EventType.pose)
+_RSSI = int(EventType.rssi)
+_EMG = int(EventType.emg)
+_BATTERY_LEVEL = int(EventType.battery_level)
+_WARMUP_COMPLETED = int(EventType.warmup_completed)
+
+_UNSET = object()
+
+_pack_emg = struct.Struct('8b').pack
+
+# #MacAddress objects by their value. There are only a handful of Myos per
+# process and their MAC address is read for (almost) every event.
+_mac_addresses = {}
+
+
+def _enum_table(enum_cls):
+  """
+  Returns a tuple of the members of *enum_cls* indexed by their value. The
+  values of the enumeration must be dense and start at zero.
+  """
+
+  table = tuple(sorted(enum_cls))
+  assert all(int(member) == i for i, member in enumerate(table)), enum_cls
+  return table
+
+
+def _enum_lookup(table, enum_cls, value):
+  """
+  Converts the integer *value* to a member of *enum_cls* using the *table*
+  returned by #_enum_table(), falling back to the #IntEnum constructor for
+  values that are out of range (and raising a #ValueError for them).
+  """
+
+  if 0 <= value < len(table):
+    return table[value]
+  return enum_cls(value)
+
+
+# Members of the enumerations that are created per event, indexed by their
+# value. Indexing is a lot cheaper than the #IntEnum constructor.
+_EVENT_TYPES = _enum_table(EventType)
+_NUM_EVENT_TYPES = len(_EVENT_TYPES)
+
+# Messages for the #InvalidOperation raised when reading a property that is
+# not available for the event's type, indexed by the required event type.
+_ONLY_IN = tuple('only available in {} events'.format(x.name)
+                 for x in _EVENT_TYPES)
+_POSES = _enum_table(Pose)
+_ARMS = _enum_table(Arm)
+_X_DIRECTIONS = _enum_table(XDirection)
+_WARMUP_STATES = _enum_table(WarmupState)
+_WARMUP_RESULTS = _enum_table(WarmupResult)
+_RESULTS = _enum_table(Result)
 
 
 class Event(_BaseWrapper):
 
+  __slots__ = ('_type_int', '_timestamp', '_device', '_mac_address', '_imu',
+               '_emg')
+
   def __init__(self, handle):
     super(Event, self).__init__(handle)
-    self._type = EventType(libmyo.libmyo_event_get_type(self._handle))
+    self._reset(handle)
+
+  def _reset(self, handle):
+    """
+    Re-seats the wrapper on a new event *handle*. This is used by #Hub.run()
+    to reuse a single #Event object for all events that are dispatched. Note
+    that an event handle is only valid during the callback that received it.
+    """
+
+    self._handle = handle
+    self._type_int = _event_get_type(handle)
+    self._timestamp = None
+    self._device = None
+    self._mac_address = _UNSET
+    self._imu = None
+    self._emg = None
+    return self
+
+  def _read_imu(self):
+    """
+    Reads the orientation, accelerometer and gyroscope data of the event at
+    once and caches it, so that reading #orientation, #acceleration and
+    #gyroscope only crosses into libmyo once per event.
+    """
+
+    if self._imu is None:
+      if self._type_int != _ORIENTATION:
+        raise InvalidOperation(_ONLY_IN[_ORIENTATION])
+      handle = self._handle
+      orientation = _event_get_orientation
+      accelerometer = _event_get_accelerometer
+      gyroscope = _event_get_gyroscope
+      self._imu = (
+        (orientation(handle, 0), orientation(handle, 1),
+         orientation(handle, 2), orientation(handle, 3)),
+        (accelerometer(handle, 0), accelerometer(handle, 1),
+         accelerometer(handle, 2)),
+        (gyroscope(handle, 0), gyroscope(handle, 1), gyroscope(handle, 2)))
+    return self._imu
 
   def __repr__(self):
     return 'Event(type={!r}, timestamp={!r}, mac_address={!r})'.format(
@@ -297,25 +453,43 @@ class Event(_BaseWrapper):
 
   @property
   def type(self):
-    return self._type
+    type_int = self._type_int
+    if 0 <= type_int < _NUM_EVENT_TYPES:
+      return _EVENT_TYPES[type_int]
+    return EventType(type_int)
 
   @property
   def timestamp(self):
-    return libmyo.libmyo_event_get_timestamp(self._handle)
+    if self._timestamp is None:
+      self._timestamp = _event_get_timestamp(self._handle)
+    return self._timestamp
 
   @property
   def device(self):
-    return Device(libmyo.libmyo_event_get_myo(self._handle))
+    if self._device is None:
+      self._device = Device(_event_get_myo(self._handle))
+    return self._device
 
   @property
   def device_name(self):
-    return str(String(libmyo.libmyo_event_get_myo_name(self._handle)))
+    string = libmyo.libmyo_event_get_myo_name(self._handle)
+    try:
+      return ffi.string(libmyo.libmyo_string_c_str(string)).decode('utf8')
+    finally:
+      libmyo.libmyo_string_free(string)
 
   @property
   def mac_address(self):
-    if self.type == EventType.emg:
-      return None
-    return MacAddress(libmyo.libmyo_event_get_mac_address(self._handle))
+    if self._mac_address is _UNSET:
+      if self._type_int == _EMG:
+        self._mac_address = None
+      else:
+        value = _event_get_mac_address(self._handle)
+        mac_address = _mac_addresses.get(value)
+        if mac_address is None:
+          mac_address = _mac_addresses[value] = MacAddress(value)
+        self._mac_address = mac_address
+    return self._mac_address
 
   @property
   def firmware_version(self):
@@ -324,143 +498,245 @@ class Event(_BaseWrapper):
 
   @property
   def arm(self):
-    if self.type != EventType.arm_synced:
-      raise InvalidOperation()
-    return Arm(libmyo.libmyo_event_get_arm(self._handle))
+    if self._type_int != _ARM_SYNCED:
+      raise InvalidOperation(_ONLY_IN[_ARM_SYNCED])
+    return _enum_lookup(_ARMS, Arm,
+        libmyo.libmyo_event_get_arm(self._handle))
 
   @property
   def x_direction(self):
-    if self.type != EventType.arm_synced:
-      raise InvalidOperation()
-    return XDirection(libmyo.libmyo_event_get_x_direction(self._handle))
+    if self._type_int != _ARM_SYNCED:
+      raise InvalidOperation(_ONLY_IN[_ARM_SYNCED])
+    return _enum_lookup(_X_DIRECTIONS, XDirection,
+        libmyo.libmyo_event_get_x_direction(self._handle))
 
   @property
   def warmup_state(self):
-    if self.type != EventType.arm_synced:
-      raise InvalidOperation()
-    return WarmupState(libmyo.libmyo_event_get_warmup_state(self._handle))
+    if self._type_int != _ARM_SYNCED:
+      raise InvalidOperation(_ONLY_IN[_ARM_SYNCED])
+    return _enum_lookup(_WARMUP_STATES, WarmupState,
+        libmyo.libmyo_event_get_warmup_state(self._handle))
 
   @property
   def warmup_result(self):
-    if self.type != EventType.warmup_completed:
-      raise InvalidOperation()
-    return WarmupResult(libmyo.libmyo_event_get_warmup_result(self._handle))
+    if self._type_int != _WARMUP_COMPLETED:
+      raise InvalidOperation(_ONLY_IN[_WARMUP_COMPLETED])
+    return _enum_lookup(_WARMUP_RESULTS, WarmupResult,
+        libmyo.libmyo_event_get_warmup_result(self._handle))
 
   @property
   def rotation_on_arm(self):
-    if self.type != EventType.arm_synced:
-      raise InvalidOperation()
+    if self._type_int != _ARM_SYNCED:
+      raise InvalidOperation(_ONLY_IN[_ARM_SYNCED])
     return libmyo.libmyo_event_get_rotation_on_arm(self._handle)
 
   @property
   def orientation(self):
-    if self.type != EventType.orientation:
-      raise InvalidOperation()
-    vals = (libmyo.libmyo_event_get_orientation(self._handle, i)
-            for i in [0, 1, 2, 3])
-    return Quaternion(*vals)
+    return Quaternion._new(*self._read_imu()[0])
 
   @property
   def acceleration(self):
-    if self.type != EventType.orientation:
-      raise InvalidOperation()
-    vals = (libmyo.libmyo_event_get_accelerometer(self._handle, i)
-            for i in [0, 1, 2])
-    return Vector(*vals)
+    return Vector._new(*self._read_imu()[1])
 
   @property
   def gyroscope(self):
-    if self.type != EventType.orientation:
-      raise InvalidOperation()
-    vals = (libmyo.libmyo_event_get_gyroscope(self._handle, i)
-            for i in [0, 1, 2])
-    return Vector(*vals)
+    return Vector._new(*self._read_imu()[2])
+
+  @property
+  def imu(self):
+    """
+    Returns a tuple of the #orientation, #acceleration and #gyroscope data
+    of an orientation event.
+    """
+
+    # libmyo returns C floats, which cffi already converts to Python floats.
+    orientation, acceleration, gyroscope = self._read_imu()
+    return (Quaternion._new(*orientation), Vector._new(*acceleration),
+            Vector._new(*gyroscope))
 
   @property
   def pose(self):
-    if self.type != EventType.pose:
-      raise InvalidOperation()
-    return Pose(libmyo.libmyo_event_get_pose(self._handle))
+    if self._type_int != _POSE:
+      raise InvalidOperation(_ONLY_IN[_POSE])
+    return _enum_lookup(_POSES, Pose, _event_get_pose(self._handle))
 
   @property
   def rssi(self):
-    if self.type != EventType.rssi:
-      raise InvalidOperation()
+    if self._type_int != _RSSI:
+      raise InvalidOperation(_ONLY_IN[_RSSI])
     return libmyo.libmyo_event_get_rssi(self._handle)
 
   @property
   def battery_level(self):
-    if self.type != EventType.battery_level:
-      raise InvalidOperation()
+    if self._type_int != _BATTERY_LEVEL:
+      raise InvalidOperation(_ONLY_IN[_BATTERY_LEVEL])
     return libmyo.libmyo_event_get_battery_level(self._handle)
 
+  def _read_emg(self):
+    if self._emg is None:
+      if self._type_int != _EMG:
+        raise InvalidOperation(_ONLY_IN[_EMG])
+      handle = self._handle
+      get = _event_get_emg
+      self._emg = (get(handle, 0), get(handle, 1), get(handle, 2),
+                   get(handle, 3), get(handle, 4), get(handle, 5),
+                   get(handle, 6), get(handle, 7))
+    return self._emg
+
   @property
   def emg(self):
-    if self.type != EventType.emg:
-      raise InvalidOperation()
-    return [libmyo.libmyo_event_get_emg(self._handle, i) for i in range(8)]
+    return list(self._read_emg())
+
+  @property
+  def emg_bytes(self):
+    """
+    The 8 EMG values of the event as #bytes of signed 8-bit integers, eg.
+    for `numpy.frombuffer(event.emg_bytes, dtype=numpy.int8)` or for writing
+    them to a file.
+    """
+
+    return _pack_emg(*self._read_emg())
+
+  def read_emg(self, out, offset=0):
+    """
+    Writes the 8 EMG values of the event into *out*, starting at *offset*,
+    and returns *out*. This can be any mutable sequence of integers, for
+    example an `array.array('b')` or an `int8` numpy array, which saves
+    creating a list per event.
+    """
+
+    for index, value in enumerate(self._read_emg(), offset):
+      out[index] = value
+    return out
 
 
 class Device(_BaseWrapper):
+  """
+  Wraps a Myo device handle. All methods accept an optional *error* argument
+  which must be an #ErrorDetails object that will be reused for the call
+  instead of allocating a new one.
+
+  Enumeration values are passed to libmyo as they are, cffi accepts them
+  since #IntEnum is a subclass of #int.
+  """
+
+  __slots__ = ()
 
   # libmyo_get_mac_address() is not in the Myo SDK 0.9.0 DLL.
   #@property
   #def mac_address(self):
   #  return MacAddress(libmyo.libmyo_get_mac_address(self._handle))
 
-  def vibrate(self, type=VibrationType.medium):
+  def vibrate(self, type=VibrationType.medium, error=None):
     if not isinstance(type, VibrationType):
       raise TypeError('expected VibrationType')
-    error = ErrorDetails()
-    libmyo.libmyo_vibrate(self._handle, int(type), error.handle)
+    error = _error_details(error)
+    libmyo.libmyo_vibrate(self._handle, type, error.handle)
     return error.raise_for_kind()
 
-  def stream_emg(self, type):
+  def stream_emg(self, type, error=None):
     if type is True: type = StreamEmg.enabled
     elif type is False: type = StreamEmg.disabled
     elif not isinstance(type, StreamEmg):
       raise TypeError('expected bool or StreamEmg')
-    error = ErrorDetails()
-    libmyo.libmyo_set_stream_emg(self._handle, int(type), error.handle)
+    error = _error_details(error)
+    libmyo.libmyo_set_stream_emg(self._handle, type, error.handle)
     error.raise_for_kind()
 
-  def request_rssi(self):
-    error = ErrorDetails()
+  def request_rssi(self, error=None):
+    error = _error_details(error)
     libmyo.libmyo_request_rssi(self._handle, error.handle)
     error.raise_for_kind()
 
-  def request_battery_level(self):
-    error = ErrorDetails()
+  def request_battery_level(self, error=None):
+    error = _error_details(error)
     libmyo.libmyo_request_battery_level(self._handle, error.handle)
     error.raise_for_kind()
 
-  def unlock(self, type=UnlockType.hold):
+  def unlock(self, type=UnlockType.hold, error=None):
     if not isinstance(type, UnlockType):
       raise TypeError('expected UnlockType')
-    error = ErrorDetails()
-    libmyo.libmyo_myo_unlock(self._handle, int(type), error.handle)
+    error = _error_details(error)
+    libmyo.libmyo_myo_unlock(self._handle, type, error.handle)
     error.raise_for_kind()
 
-  def lock(self):
-    error = ErrorDetails()
+  def lock(self, error=None):
+    error = _error_details(error)
     libmyo.libmyo_myo_lock(self._handle, error.handle)
     error.raise_for_kind()
 
-  def notify_user_action(self, type=UserActionType.single):
+  def notify_user_action(self, type=UserActionType.single, error=None):
     if not isinstance(type, UserActionType):
       raise TypeError('expected UserActionType')
-    error = ErrorDetails()
-    libmyo.libmyo_myo_notify_user_action(self._handle, int(type), error.handle)
+    error = _error_details(error)
+    libmyo.libmyo_myo_notify_user_action(self._handle, type, error.handle)
     error.raise_for_kind()
 
 
-class String(_BaseWrapper):
+class _HubState(object):
+  """
+  The state of a #Hub that the event callback needs. It is passed to
+  #_hub_dispatch() through the *user_data* argument of `libmyo_run()`. The
+  state does not reference the #Hub to avoid a reference cycle through the
+  handle that the #Hub keeps alive.
+  """
 
-  def __str__(self):
-    return ffi.string(libmyo.libmyo_string_c_str(self._handle)).decode('utf8')
+  def __init__(self):
+    self.handler = None
+    self.event = Event.__new__(Event)  # Reused for every event.
+    self.exc_info = None
+    self.stop_requested = False
+    self.stopped = False
+
+
+_CONTINUE = int(HandlerResult.continue_)
+_STOP = int(HandlerResult.stop)
+
+# The C callback of #_hub_dispatch(), see #_get_hub_callback().
+_hub_callback = None
+
+
+def _get_hub_callback():
+  # The libffi closure is created on the first #Hub.run() instead of on
+  # import, so that a failure to allocate it does not break `import myo`.
+  global _hub_callback
+  if _hub_callback is None:
+    _hub_callback = ffi.callback(_handler_t, _hub_dispatch)
+  return _hub_callback
+
+
+def _hub_dispatch(userdata, event):
+  # This is the event handler for all Hubs, the Hub is identified by
+  # *userdata*.
+  state = ffi.from_handle(userdata)
+
+  # The stop flags are plain attributes that are read and written without
+  # acquiring a lock. Single attribute reads and writes are atomic with the
+  # GIL.
+  if state.stop_requested:
+    state.stopped = True
+    return _STOP
+
+  # The handler's result is checked by identity for the common cases, only
+  # other values are validated through #HandlerResult. libmyo gets a plain
+  # int back either way.
+  try:
+    result = state.handler(state.event._reset(event))
+    if result is None or result is True:
+      return _CONTINUE
+    elif result is False:
+      result = _STOP
+    else:
+      result = int(HandlerResult(result))
+  except BaseException:
+    # Keep the first exception, it is re-raised by #Hub.run().
+    if state.exc_info is None:
+      state.exc_info = sys.exc_info()
+    result = _STOP
 
-  def __del__(self):
-    libmyo.libmyo_string_free(self._handle)
+  if result == _STOP:
+    state.stopped = True
+  return result
 
 
 class Hub(_BaseWrapper):
@@ -468,21 +744,28 @@ class Hub(_BaseWrapper):
   Low-level wrapper for a Myo Hub object.
   """
 
+  __slots__ = ('_locking_policy', '_lock', '_running', '_state', '_userdata',
+               '_run_error', '__weakref__')
+
   def __init__(self, application_identifier='com.niklasrosenstein.myo-python'):
     super(Hub, self).__init__(ffi.new('libmyo_hub_t*'))
-    error = ErrorDetails()
+    error = _error_details()
     libmyo.libmyo_init_hub(self._handle, application_identifier.encode('ascii'), error.handle)
     error.raise_for_kind()
     self.locking_policy = LockingPolicy.none
     self._lock = threading.Lock()
     self._running = False
-    self._stop_requested = False
-    self._stopped = False
+    self._state = _HubState()
+    self._userdata = ffi.new_handle(self._state)
+    self._run_error = ErrorDetails()
 
   def __del__(self):
-    if self._handle[0]:
+    # Not using the thread's shared #ErrorDetails here, the garbage collector
+    # may run this in the middle of another call that uses it.
+    handle = getattr(self, '_handle', None)
+    if handle is not None and handle[0]:
       error = ErrorDetails()
-      libmyo.libmyo_shutdown_hub(self._handle[0], error.handle)
+      libmyo.libmyo_shutdown_hub(handle[0], error.handle)
       error.raise_for_kind()
 
   @property
@@ -497,9 +780,10 @@ class Hub(_BaseWrapper):
   def locking_policy(self, policy):
     if not isinstance(policy, LockingPolicy):
       raise TypeError('expected LockingPolicy')
-    error = ErrorDetails()
-    libmyo.libmyo_set_locking_policy(self._handle[0], int(policy), error.handle)
+    error = _error_details()
+    libmyo.libmyo_set_locking_policy(self._handle[0], policy, error.handle)
     error.raise_for_kind()
+    self._locking_policy = policy
 
   @property
   def running(self):
@@ -514,73 +798,124 @@ class Hub(_BaseWrapper):
     #False represents #HandlerResult.stop and #True and #None represent
     #HandlerResult.continue_.
 
+    The same #Event object is passed to the handler for every event, thus it
+    must not be stored and used after the handler returned. The data that is
+    read from it (eg. #Event.emg or #Event.orientation) can be stored freely.
+
     If the run did not complete due to the handler returning #HandlerResult.stop
     or #False or the procedure was cancelled via #Hub.stop(), this function
     returns #False. If the full *duration_ms* completed, #True is returned.
 
     This function blocks the caller until either *duration_ms* passed, the
     handler returned #HandlerResult.stop or #False or #Hub.stop() was called.
+
+    The *handler* may also be a native C function pointer (a cffi `CData`
+    object, eg. `ffi.cast('libmyo_handler_t', address)` of a function compiled
+    with Numba's `@cfunc`). It is passed to libmyo directly, thus no Python
+    code runs per event. Note that #Hub.stop() has no effect on a native
+    handler and that the function returns #True unless an error occurred.
     """
 
-    if not callable(handler):
+    native_handler = None
+    if isinstance(handler, ffi.CData):
+      native_handler = ffi.cast(_handler_t, handler)
+    elif not callable(handler):
       if hasattr(handler, 'on_event'):
         handler = handler.on_event
       else:
         raise TypeError('expected callable or DeviceListener')
 
+    # Accepts any integer type (eg. numpy integers), but not floats.
+    duration_ms = operator.index(duration_ms)
+
+    state = self._state
     with self._lock:
       if self._running:
         raise RuntimeError('a handler is already running in the Hub')
       self._running = True
-      self._stop_requested = False
-      self._stopped = False
+      state.stop_requested = False
+      state.stopped = False
+      state.exc_info = None
 
-    exc_box = []
-
-    def callback_on_error(*exc_info):
-      exc_box.append(exc_info)
-      with self._lock:
-        self._stopped = True
-      return HandlerResult.stop
-
-    def callback(_, event):
-      with self._lock:
-        if self._stop_requested:
-          self._stopped = True
-          return HandlerResult.stop
-
-      result = handler(Event(event))
-      if result is None or result is True:
-        result = HandlerResult.continue_
-      elif result is False:
-        result = HandlerResult.stop
-      else:
-        result = HandlerResult(result)
-      if result == HandlerResult.stop:
-        with self._lock:
-          self._stopped = True
-
-      return result
-
-    cdecl = 'libmyo_handler_result_t(void*, libmyo_event_t)'
-    callback = ffi.callback(cdecl, callback, onerror=callback_on_error)
+    if native_handler is not None:
+      callback, userdata = native_handler, ffi.NULL
+    else:
+      state.handler = handler
+      callback, userdata = _get_hub_callback(), self._userdata
 
+    error = self._run_error.reset()
     try:
-      error = ErrorDetails()
-      libmyo.libmyo_run(self._handle[0], duration_ms, callback, ffi.NULL, error.handle)
+      libmyo.libmyo_run(self._handle[0], duration_ms, callback, userdata, error.handle)
       error.raise_for_kind()
-      if exc_box:
-        six.reraise(*exc_box[0])
+      exc_info, state.exc_info = state.exc_info, None
+      if exc_info:
+        try:
+          raise exc_info[1].with_traceback(exc_info[2])
+        finally:
+          exc_info = None  # Break the reference cycle with the traceback.
     finally:
+      # Don't keep an exception that was not re-raised because libmyo also
+      # reported an error, it must not leak into the next run.
+      state.handler = None
+      state.exc_info = None
       with self._lock:
         self._running = False
-        result = not self._stopped
+        result = not state.stopped
 
     return result
 
+  def run_capture(self, duration_ms):
+    """
+    Runs the Hub for *duration_ms* milliseconds and records the EMG data
+    that is received without creating #Event objects. Returns a tuple of two
+    #array.array objects: the timestamps (typecode `Q`) and the EMG values
+    (typecode `b`, eight values per timestamp). The samples of all connected
+    devices are recorded in the order they are received.
+
+    The buffers can be viewed as NumPy arrays without copying the data, eg.
+    `numpy.frombuffer(emg, dtype=numpy.int8).reshape(-1, 8)`.
+
+    Note that EMG streaming must already be enabled for the device (see
+    #Device.stream_emg()). #Hub.stop() can be used to end the capture early.
+    An exception in the capture stops it and is re-raised, like an exception
+    of a #run() handler.
+    """
+
+    timestamps = array.array('Q')
+    emg = array.array('b')
+    append_timestamp = timestamps.append
+    append_emg = emg.append
+    get_type = _event_get_type
+    get_timestamp = _event_get_timestamp
+    get_emg = _event_get_emg
+    continue_, stop = _CONTINUE, _STOP
+    state = self._state
+
+    def callback(_, event):
+      if state.stop_requested:
+        return stop
+      if get_type(event) == _EMG:
+        append_timestamp(get_timestamp(event))
+        for i in range(8):
+          append_emg(get_emg(event, i))
+      return continue_
+
+    def on_error(exc_type, exc_value, exc_tb):
+      # Handled like an exception in #_hub_dispatch(), #run() re-raises it.
+      if state.exc_info is None:
+        state.exc_info = (exc_type, exc_value, exc_tb)
+      state.stopped = True
+      return stop
+
+    self.run(ffi.callback(_handler_t, callback, onerror=on_error), duration_ms)
+    return timestamps, emg
+
   def run_forever(self, handler, duration_ms=500):
+    # Note that #Hub.stop() is only noticed when an event is received or when
+    # libmyo_run() returns, thus *duration_ms* bounds the time it takes to
+    # stop if no Myo is sending events.
     while self.run(handler, duration_ms):
-      if self._stop_requested:
+      if self._state.stop_requested:
         break
 
   @contextlib.contextmanager
@@ -593,8 +928,7 @@ class Hub(_BaseWrapper):
       self.stop()
 
   def stop(self):
-    with self._lock:
-      self._stop_requested = True
+    self._state.stop_requested = True
 
 
 __all__ = [
@@ -604,5 +938,5 @@ __all__ = [
   'Arm', 'XDirection', 'UnlockType', 'UserActionType', 'WarmupState',
   'WarmupResult',
 
-  'Event', 'Device', 'Hub', 'init'
+  'ErrorDetails', 'Event', 'Device', 'Hub', 'init'
 ]
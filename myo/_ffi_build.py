@@ -0,0 +1,59 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2015-2018 Niklas Rosenstein
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""
+Generates the `myo/_libmyo_cffi.py` module from `libmyo.h` with cffi's
+out-of-line ABI mode, so the header does not need to be parsed on every
+import of the `myo` module. Run this script whenever `libmyo.h` changes:
+
+    $ python -m myo._ffi_build
+"""
+
+import cffi
+import os
+import pkgutil
+
+
+def get_cdef():
+  """
+  Reads `libmyo.h` and removes everything that cffi can not parse.
+  """
+
+  string = pkgutil.get_data(__name__, 'libmyo.h').decode('utf8')
+  # Remove stuff that cffi can not parse.
+  string = '\n'.join(line for line in string.splitlines()
+                     if not line.lstrip().startswith('#'))
+  string = string.replace('LIBMYO_EXPORT', '')
+  string = string.replace('extern "C" {', '')
+  string = string.replace('} // extern "C"', '')
+  return string
+
+
+def make_ffi():
+  ffi = cffi.FFI()
+  ffi.cdef(get_cdef())
+  ffi.set_source('myo._libmyo_cffi', None)
+  return ffi
+
+
+if __name__ == '__main__':
+  make_ffi().compile(tmpdir=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), verbose=True)
@@ -0,0 +1,10 @@
+# auto-generated file
+import _cffi_backend
+
+ffi = _cffi_backend.FFI('myo._libmyo_cffi',
+    _version = 0x2601,
+    _types = b'\x00\x00\x21\x0D\x00\x00\x7E\x03\x00\x00\x00\x0F\x00\x00\x71\x0D\x00\x00\x7E\x03\x00\x00\x00\x0F\x00\x00\x71\x0D\x00\x00\x04\x11\x00\x00\x05\x0B\x00\x00\x00\x0F\x00\x00\x71\x0D\x00\x00\x04\x11\x00\x00\x08\x01\x00\x00\x00\x0F\x00\x00\x72\x0D\x00\x00\x04\x11\x00\x00\x00\x0F\x00\x00\x72\x0D\x00\x00\x04\x11\x00\x00\x08\x01\x00\x00\x00\x0F\x00\x00\x73\x0D\x00\x00\x04\x11\x00\x00\x00\x0F\x00\x00\x75\x0D\x00\x00\x01\x11\x00\x00\x04\x11\x00\x00\x00\x0F\x00\x00\x77\x0D\x00\x00\x04\x11\x00\x00\x00\x0F\x00\x00\x78\x0D\x00\x00\x01\x03\x00\x00\x70\x03\x00\x00\x20\x11\x00\x00\x00\x0F\x00\x00\x78\x0D\x00\x00\x01\x11\x00\x00\x00\x0F\x00\x00\x78\x0D\x00\x00\x01\x11\x00\x00\x04\x0B\x00\x00\x20\x11\x00\x00\x00\x0F\x00\x00\x78\x0D\x00\x00\x01\x11\x00\x00\x08\x0B\x00\x00\x20\x11\x00\x00\x00\x0F\x00\x00\x78\x0D\x00\x00\x01\x11\x00\x00\x09\x0B\x00\x00\x20\x11\x00\x00\x00\x0F\x00\x00\x78\x0D\x00\x00\x01\x11\x00\x00\x0A\x0B\x00\x00\x20\x11\x00\x00\x00\x0F\x00\x00\x78\x0D\x00\x00\x01\x11\x00\x00\x0C\x0B\x00\x00\x20\x11\x00\x00\x00\x0F\x00\x00\x78\x0D\x00\x00\x01\x11\x00\x00\x08\x01\x00\x00\x18\x03\x00\x00\x01\x11\x00\x00\x20\x11\x00\x00\x00\x0F\x00\x00\x78\x0D\x00\x00\x01\x11\x00\x00\x20\x11\x00\x00\x00\x0F\x00\x00\x79\x0D\x00\x00\x04\x11\x00\x00\x00\x0F\x00\x00\x7A\x0D\x00\x00\x04\x11\x00\x00\x00\x0F\x00\x00\x7B\x0D\x00\x00\x04\x11\x00\x00\x00\x0F\x00\x00\x7C\x0D\x00\x00\x04\x11\x00\x00\x00\x0F\x00\x00\x68\x0D\x00\x00\x21\x11\x00\x00\x00\x0F\x00\x00\x68\x0D\x00\x00\x01\x11\x00\x00\x00\x0F\x00\x00\x68\x0D\x00\x00\x04\x11\x00\x00\x00\x0F\x00\x00\x7D\x0D\x00\x00\x04\x11\x00\x00\x00\x0F\x00\x00\x0C\x0D\x00\x00\x04\x11\x00\x00\x0B\x0B\x00\x00\x00\x0F\x00\x00\x01\x0D\x00\x00\x18\x01\x00\x00\x00\x0F\x00\x00\x01\x0D\x00\x00\x04\x11\x00\x00\x00\x0F\x00\x00\x7E\x0D\x00\x00\x01\x11\x00\x00\x00\x0F\x00\x00\x02\x01\x00\x00\x0D\x01\x00\x00\x11\x01\x00\x00\x00\x0B\x00\x00\x01\x0B\x00\x00\x02\x0B\x00\x00\x03\x0B\x00\x00\x06\x0B\x00\x00\x07\x0B\x00\x00\x0D\x0B\x00\x00\x0E\x0B\x00\x00\x0F\x0B\x00\x00\x16\x01\x00\x00\x12\x01\x00\x00\x00\x01',
+    _globals = (b'\xFF\xFF\xFF\x0Blibmyo_arm_left',1,b'\xFF\xFF\xFF\x0Blibmyo_arm_right',0,b'\xFF\xFF\xFF\x0Blibmyo_arm_unknown',2,b'\xFF\xFF\xFF\x0Blibmyo_error',1,b'\x00\x00\x00\x23libmyo_error_cstring',0,b'\xFF\xFF\xFF\x0Blibmyo_error_invalid_argument',2,b'\x00\x00\x24\x23libmyo_error_kind',0,b'\xFF\xFF\xFF\x0Blibmyo_error_runtime',3,b'\xFF\xFF\xFF\x0Blibmyo_event_arm_synced',4,b'\xFF\xFF\xFF\x0Blibmyo_event_arm_unsynced',5,b'\xFF\xFF\xFF\x0Blibmyo_event_battery_level',12,b'\xFF\xFF\xFF\x0Blibmyo_event_connected',2,b'\xFF\xFF\xFF\x0Blibmyo_event_disconnected',3,b'\xFF\xFF\xFF\x0Blibmyo_event_emg',11,b'\x00\x00\x0A\x23libmyo_event_get_accelerometer',0,b'\x00\x00\x15\x23libmyo_event_get_arm',0,b'\x00\x00\x60\x23libmyo_event_get_battery_level',0,b'\x00\x00\x11\x23libmyo_event_get_emg',0,b'\x00\x00\x63\x23libmyo_event_get_firmware_version',0,b'\x00\x00\x0A\x23libmyo_event_get_gyroscope',0,b'\x00\x00\x5D\x23libmyo_event_get_mac_address',0,b'\x00\x00\x6A\x23libmyo_event_get_myo',0,b'\x00\x00\x6A\x23libmyo_event_get_myo_name',0,b'\x00\x00\x06\x23libmyo_event_get_orientation',0,b'\x00\x00\x1C\x23libmyo_event_get_pose',0,b'\x00\x00\x03\x23libmyo_event_get_rotation_on_arm',0,b'\x00\x00\x0E\x23libmyo_event_get_rssi',0,b'\x00\x00\x5D\x23libmyo_event_get_timestamp',0,b'\x00\x00\x54\x23libmyo_event_get_type',0,b'\x00\x00\x4B\x23libmyo_event_get_warmup_result',0,b'\x00\x00\x4E\x23libmyo_event_get_warmup_state',0,b'\x00\x00\x51\x23libmyo_event_get_x_direction',0,b'\xFF\xFF\xFF\x0Blibmyo_event_locked',10,b'\xFF\xFF\xFF\x0Blibmyo_event_orientation',6,b'\xFF\xFF\xFF\x0Blibmyo_event_paired',0,b'\xFF\xFF\xFF\x0Blibmyo_event_pose',7,b'\xFF\xFF\xFF\x0Blibmyo_event_rssi',8,b'\xFF\xFF\xFF\x0Blibmyo_event_unlocked',9,b'\xFF\xFF\xFF\x0Blibmyo_event_unpaired',1,b'\xFF\xFF\xFF\x0Blibmyo_event_warmup_completed',13,b'\x00\x00\x6D\x23libmyo_free_error_details',0,b'\x00\x00\x5A\x23libmyo_get_mac_address',0,b'\xFF\xFF\xFF\x0Blibmyo_handler_continue',0,b'\xFF\xFF\xFF\x0Blibmyo_handler_stop',1,b'\xFF\xFF\xFF\x0Blibmyo_hardware_rev_c',1,b'\xFF\xFF\xFF\x0Blibmyo_hardware_rev_d',2,b'\x00\x00\x1F\x23libmyo_init_hub',0,b'\xFF\xFF\xFF\x0Blibmyo_locking_policy_none',0,b'\xFF\xFF\xFF\x0Blibmyo_locking_policy_standard',1,b'\x00\x00\x67\x23libmyo_mac_address_to_string',0,b'\x00\x00\x47\x23libmyo_myo_lock',0,b'\x00\x00\x36\x23libmyo_myo_notify_user_action',0,b'\x00\x00\x31\x23libmyo_myo_unlock',0,b'\xFF\xFF\xFF\x0Blibmyo_num_poses',6,b'\xFF\xFF\xFF\x0Blibmyo_orientation_w',3,b'\xFF\xFF\xFF\x0Blibmyo_orientation_x',0,b'\xFF\xFF\xFF\x0Blibmyo_orientation_y',1,b'\xFF\xFF\xFF\x0Blibmyo_orientation_z',2,b'\xFF\xFF\xFF\x0Blibmyo_pose_double_tap',5,b'\xFF\xFF\xFF\x0Blibmyo_pose_fingers_spread',4,b'\xFF\xFF\xFF\x0Blibmyo_pose_fist',1,b'\xFF\xFF\xFF\x0Blibmyo_pose_rest',0,b'\xFF\xFF\xFF\x0Blibmyo_pose_unknown',65535,b'\xFF\xFF\xFF\x0Blibmyo_pose_wave_in',2,b'\xFF\xFF\xFF\x0Blibmyo_pose_wave_out',3,b'\x00\x00\x47\x23libmyo_request_battery_level',0,b'\x00\x00\x47\x23libmyo_request_rssi',0,b'\x00\x00\x40\x23libmyo_run',0,b'\x00\x00\x27\x23libmyo_set_locking_policy',0,b'\x00\x00\x2C\x23libmyo_set_stream_emg',0,b'\x00\x00\x47\x23libmyo_shutdown_hub',0,b'\xFF\xFF\xFF\x0Blibmyo_stream_emg_disabled',0,b'\xFF\xFF\xFF\x0Blibmyo_stream_emg_enabled',1,b'\x00\x00\x00\x23libmyo_string_c_str',0,b'\x00\x00\x6D\x23libmyo_string_free',0,b'\x00\x00\x57\x23libmyo_string_to_mac_address',0,b'\xFF\xFF\xFF\x0Blibmyo_success',0,b'\xFF\xFF\xFF\x0Blibmyo_unlock_hold',1,b'\xFF\xFF\xFF\x0Blibmyo_unlock_timed',0,b'\xFF\xFF\xFF\x0Blibmyo_user_action_single',0,b'\xFF\xFF\xFF\x0Blibmyo_version_hardware_rev',3,b'\xFF\xFF\xFF\x0Blibmyo_version_major',0,b'\xFF\xFF\xFF\x0Blibmyo_version_minor',1,b'\xFF\xFF\xFF\x0Blibmyo_version_patch',2,b'\x00\x00\x3B\x23libmyo_vibrate',0,b'\xFF\xFF\xFF\x0Blibmyo_vibration_long',2,b'\xFF\xFF\xFF\x0Blibmyo_vibration_medium',1,b'\xFF\xFF\xFF\x0Blibmyo_vibration_short',0,b'\xFF\xFF\xFF\x0Blibmyo_warmup_result_failed_timeout',2,b'\xFF\xFF\xFF\x0Blibmyo_warmup_result_success',1,b'\xFF\xFF\xFF\x0Blibmyo_warmup_result_unknown',0,b'\xFF\xFF\xFF\x0Blibmyo_warmup_state_cold',1,b'\xFF\xFF\xFF\x0Blibmyo_warmup_state_unknown',0,b'\xFF\xFF\xFF\x0Blibmyo_warmup_state_warm',2,b'\xFF\xFF\xFF\x0Blibmyo_x_direction_toward_elbow',1,b'\xFF\xFF\xFF\x0Blibmyo_x_direction_toward_wrist',0,b'\xFF\xFF\xFF\x0Blibmyo_x_direction_unknown',2),
+    _enums = (b'\x00\x00\x00\x73\x00\x00\x00\x16$libmyo_arm_t\x00libmyo_arm_right,libmyo_arm_left,libmyo_arm_unknown',b'\x00\x00\x00\x74\x00\x00\x00\x16$libmyo_event_type_t\x00libmyo_event_paired,libmyo_event_unpaired,libmyo_event_connected,libmyo_event_disconnected,libmyo_event_arm_synced,libmyo_event_arm_unsynced,libmyo_event_orientation,libmyo_event_pose,libmyo_event_rssi,libmyo_event_unlocked,libmyo_event_locked,libmyo_event_emg,libmyo_event_battery_level,libmyo_event_warmup_completed',b'\x00\x00\x00\x75\x00\x00\x00\x16$libmyo_handler_result_t\x00libmyo_handler_continue,libmyo_handler_stop',b'\x00\x00\x00\x76\x00\x00\x00\x16$libmyo_hardware_rev_t\x00libmyo_hardware_rev_c,libmyo_hardware_rev_d',b'\x00\x00\x00\x29\x00\x00\x00\x16$libmyo_locking_policy_t\x00libmyo_locking_policy_none,libmyo_locking_policy_standard',b'\x00\x00\x00\x08\x00\x00\x00\x16$libmyo_orientation_index\x00libmyo_orientation_x,libmyo_orientation_y,libmyo_orientation_z,libmyo_orientation_w',b'\x00\x00\x00\x77\x00\x00\x00\x16$libmyo_pose_t\x00libmyo_pose_rest,libmyo_pose_fist,libmyo_pose_wave_in,libmyo_pose_wave_out,libmyo_pose_fingers_spread,libmyo_pose_double_tap,libmyo_num_poses,libmyo_pose_unknown',b'\x00\x00\x00\x78\x00\x00\x00\x16$libmyo_result_t\x00libmyo_success,libmyo_error,libmyo_error_invalid_argument,libmyo_error_runtime',b'\x00\x00\x00\x2E\x00\x00\x00\x16$libmyo_stream_emg_t\x00libmyo_stream_emg_disabled,libmyo_stream_emg_enabled',b'\x00\x00\x00\x33\x00\x00\x00\x16$libmyo_unlock_type_t\x00libmyo_unlock_timed,libmyo_unlock_hold',b'\x00\x00\x00\x38\x00\x00\x00\x16$libmyo_user_action_type_t\x00libmyo_user_action_single',b'\x00\x00\x00\x65\x00\x00\x00\x16$libmyo_version_component_t\x00libmyo_version_major,libmyo_version_minor,libmyo_version_patch,libmyo_version_hardware_rev',b'\x00\x00\x00\x3D\x00\x00\x00\x16$libmyo_vibration_type_t\x00libmyo_vibration_short,libmyo_vibration_medium,libmyo_vibration_long',b'\x00\x00\x00\x79\x00\x00\x00\x16$libmyo_warmup_result_t\x00libmyo_warmup_result_unknown,libmyo_warmup_result_success,libmyo_warmup_result_failed_timeout',b'\x00\x00\x00\x7A\x00\x00\x00\x16$libmyo_warmup_state_t\x00libmyo_warmup_state_unknown,libmyo_warmup_state_cold,libmyo_warmup_state_warm',b'\x00\x00\x00\x7B\x00\x00\x00\x16$libmyo_x_direction_t\x00libmyo_x_direction_toward_wrist,libmyo_x_direction_toward_elbow,libmyo_x_direction_unknown'),
+    _typenames = (b'\x00\x00\x00\x73libmyo_arm_t',b'\x00\x00\x00\x01libmyo_error_details_t',b'\x00\x00\x00\x04libmyo_event_t',b'\x00\x00\x00\x74libmyo_event_type_t',b'\x00\x00\x00\x75libmyo_handler_result_t',b'\x00\x00\x00\x43libmyo_handler_t',b'\x00\x00\x00\x76libmyo_hardware_rev_t',b'\x00\x00\x00\x01libmyo_hub_t',b'\x00\x00\x00\x29libmyo_locking_policy_t',b'\x00\x00\x00\x01libmyo_myo_t',b'\x00\x00\x00\x08libmyo_orientation_index',b'\x00\x00\x00\x77libmyo_pose_t',b'\x00\x00\x00\x78libmyo_result_t',b'\x00\x00\x00\x2Elibmyo_stream_emg_t',b'\x00\x00\x00\x01libmyo_string_t',b'\x00\x00\x00\x33libmyo_unlock_type_t',b'\x00\x00\x00\x38libmyo_user_action_type_t',b'\x00\x00\x00\x65libmyo_version_component_t',b'\x00\x00\x00\x3Dlibmyo_vibration_type_t',b'\x00\x00\x00\x79libmyo_warmup_result_t',b'\x00\x00\x00\x7Alibmyo_warmup_state_t',b'\x00\x00\x00\x7Blibmyo_x_direction_t'),
+)
@@ -20,9 +20,8 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-import six
-
 MAX_VALUE = (16 ** 12 - 1)
+_HEX_DIGITS = b'0123456789abcdefABCDEF'
 
 
 def encode(value):
@@ -42,11 +41,9 @@ def encode(value):
   # mac address displayed by the hello-myo SDK sample.
   # See issue #7
 
-  string = ('%x' % value).rjust(12, '0')
-  assert len(string) == 12
-
-  result = ':'.join(''.join(pair) for pair in zip(*[iter(string)]*2))
-  return result.upper()
+  s = format(value, '012X')
+  return '%s:%s:%s:%s:%s:%s' % (
+    s[0:2], s[2:4], s[4:6], s[6:8], s[8:10], s[10:12])
 
 
 def decode(bstr):
@@ -54,14 +51,12 @@ def decode(bstr):
   Decodes an ASCII encoded binary MAC address tring into a number.
   """
 
-  bstr = bstr.replace(b':', b'')
-  if len(bstr) != 12:
-    raise ValueError('not a valid MAC address: {!r}'.format(bstr))
-
-  try:
-    return int(bstr, 16)
-  except ValueError:
+  # int() would also accept a sign, whitespace and underscores, so the
+  # digits are checked by deleting all valid ones (both in C).
+  digits = bstr.replace(b':', b'')
+  if len(digits) != 12 or digits.translate(None, _HEX_DIGITS):
     raise ValueError('not a valid MAC address: {!r}'.format(bstr))
+  return int(digits, 16)
 
 
 class MacAddress(object):
@@ -69,17 +64,19 @@ class MacAddress(object):
   Represents a MAC address. Instances of this class are immutable.
   """
 
+  __slots__ = ('_value', '_string')
+
   def __init__(self, value):
-    if isinstance(value, six.integer_types):
+    if isinstance(value, int):
       if value < 0 or value > MAX_VALUE:
         raise ValueError('value {!r} out of MAC address range'.format(value))
-    elif isinstance(value, six.string_to_int):
-      if isinstance(value, six.text_type):
+    elif isinstance(value, (str, bytes)):
+      if isinstance(value, str):
         value = value.encode('ascii')
       value = decode(value)
     else:
       msg = 'expected string, bytes or int for MacAddress, got {}'
-      return TypeError(msg.format(type(value).__name__))
+      raise TypeError(msg.format(type(value).__name__))
 
     self._value = value
     self._string = None
@@ -92,6 +89,14 @@ class MacAddress(object):
   def __repr__(self):
     return '<MAC {}>'.format(self)
 
+  def __eq__(self, other):
+    if isinstance(other, MacAddress):
+      return self._value == other._value
+    return NotImplemented
+
+  def __hash__(self):
+    return hash(self._value)
+
   @property
   def value(self):
     return self._value
@@ -21,7 +21,7 @@
 # IN THE SOFTWARE.
 
 import math
-import six
+import numbers
 
 
 class Vector(object):
@@ -32,11 +32,24 @@ class Vector(object):
   __slots__ = ('x', 'y', 'z')
 
   def __init__(self, x, y, z):
-    super(Vector, self).__init__()
     self.x = float(x)
     self.y = float(y)
     self.z = float(z)
 
+  @classmethod
+  def _new(cls, x, y, z):
+    # Internal constructor for components that are floats already.
+    self = object.__new__(cls)
+    self.x = x
+    self.y = y
+    self.z = z
+    return self
+
+  # The operators accept scalars (checked by exact type first, then as
+  # #numbers.Real, which are converted to #float) or any object with x, y and
+  # z members. Other operands return #NotImplemented so that Python can try
+  # the reflected operation.
+
   def __mul__(self, rhs):
     """
     Multiplies the vector with *rhs* which can be either a scalar
@@ -44,30 +57,51 @@ class Vector(object):
     product.
     """
 
-    if isinstance(rhs, (six.integer_types, float)):
-      return Vector(self.x * rhs, self.y * rhs, self.z * rhs)
-    else:
+    t = type(rhs)
+    if (t is not float and t is not int and t is not Vector and
+        isinstance(rhs, numbers.Real)):
+      rhs = float(rhs)
+      t = float
+    if t is float or t is int:
+      return Vector._new(self.x * rhs, self.y * rhs, self.z * rhs)
+    try:
       return self.dot(rhs)
+    except AttributeError:
+      return NotImplemented
 
   def __add__(self, rhs):
     """
     Adds *self* to *rhs* and returns a new vector.
     """
 
-    if isinstance(rhs, (six.integer_types, float)):
-      return Vector(self.x + rhs, self.y + rhs, self.z + rhs)
-    else:
-      return Vector(self.x + rhs.x, self.y + rhs.y, self.z + rhs.z)
+    t = type(rhs)
+    if (t is not float and t is not int and t is not Vector and
+        isinstance(rhs, numbers.Real)):
+      rhs = float(rhs)
+      t = float
+    if t is float or t is int:
+      return Vector._new(self.x + rhs, self.y + rhs, self.z + rhs)
+    try:
+      return Vector._new(self.x + rhs.x, self.y + rhs.y, self.z + rhs.z)
+    except AttributeError:
+      return NotImplemented
 
   def __sub__(self, rhs):
     """
     Substracts *self* from *rhs* and returns a new vector.
     """
 
-    if isinstance(rhs, (six.integer_types, float)):
-      return Vector(self.x - rhs, self.y - rhs, self.z - rhs)
-    else:
-      return Vector(self.x - rhs.x, self.y - rhs.y, self.z - rhs.z)
+    t = type(rhs)
+    if (t is not float and t is not int and t is not Vector and
+        isinstance(rhs, numbers.Real)):
+      rhs = float(rhs)
+      t = float
+    if t is float or t is int:
+      return Vector._new(self.x - rhs, self.y - rhs, self.z - rhs)
+    try:
+      return Vector._new(self.x - rhs.x, self.y - rhs.y, self.z - rhs.z)
+    except AttributeError:
+      return NotImplemented
 
   def __iter__(self):
     return iter((self.x, self.y, self.z))
@@ -80,7 +114,7 @@ class Vector(object):
     Returns the inversion of the vector.
     """
 
-    return Vector(-self.x, -self.y, -self.z)
+    return Vector._new(-self.x, -self.y, -self.z)
 
   def __getitem__(self, index):
     return (self.x, self.y, self.z)[index]
@@ -90,22 +124,24 @@ class Vector(object):
     Returns a shallow copy of the vector.
     """
 
-    return Vector(self.x, self.y, self.z)
+    return Vector._new(self.x, self.y, self.z)
 
   def magnitude(self):
     """
     Return the magnitude of this vector.
     """
 
-    return math.sqrt(self.x ** 2 + self.y ** 2 + self.z ** 2)
+    x, y, z = self.x, self.y, self.z
+    return math.sqrt(x * x + y * y + z * z)
 
   def normalized(self):
     """
     Returns a normalized copy of this vector.
     """
 
-    norm = self.magnitude()
-    return Vector(self.x / norm, self.y / norm, self.z / norm)
+    x, y, z = self.x, self.y, self.z
+    scale = 1.0 / math.sqrt(x * x + y * y + z * z)
+    return Vector._new(x * scale, y * scale, z * scale)
 
   def dot(self, rhs):
     """
@@ -119,7 +155,7 @@ class Vector(object):
     Return the cross product of this vector and *rhs*.
     """
 
-    return Vector(
+    return Vector._new(
       self.y * rhs.z - self.z * rhs.y,
       self.z * rhs.x - self.x * rhs.z,
       self.x * rhs.y - self.y * rhs.x)
@@ -129,7 +165,15 @@ class Vector(object):
     Return the angle between this vector and *rhs* in radians.
     """
 
-    return math.acos(self.dot(rhs) / (self.magnitude() * rhs.magnitude()))
+    # atan2(|a x b|, a . b) stays accurate for (anti-)parallel vectors where
+    # acos() of the normalized dot product loses precision.
+    ax, ay, az = self.x, self.y, self.z
+    bx, by, bz = rhs.x, rhs.y, rhs.z
+    cx = ay * bz - az * by
+    cy = az * bx - ax * bz
+    cz = ax * by - ay * bx
+    return math.atan2(math.sqrt(cx * cx + cy * cy + cz * cz),
+                      ax * bx + ay * by + az * bz)
 
   __abs__ = magnitude
 
@@ -148,12 +192,21 @@ class Quaternion(object):
   __slots__ = ('x', 'y', 'z', 'w')
 
   def __init__(self, x, y, z, w):
-    super(Quaternion, self).__init__()
     self.x = float(x)
     self.y = float(y)
     self.z = float(z)
     self.w = float(w)
 
+  @classmethod
+  def _new(cls, x, y, z, w):
+    # Internal constructor for components that are floats already.
+    self = object.__new__(cls)
+    self.x = x
+    self.y = y
+    self.z = z
+    self.w = w
+    return self
+
   def __mul__(self, rhs):
     """
     Multiplies *self* with the #Quaternion *rhs* and returns a new #Quaternion.
@@ -161,11 +214,13 @@ class Quaternion(object):
 
     if not isinstance(rhs, Quaternion):
       raise TypeError('can only multiply with Quaternion')
-    return Quaternion(
-      self.w * rhs.x + self.x * rhs.w + self.y * rhs.z - self.z * rhs.y,
-      self.w * rhs.y - self.x * rhs.z + self.y * rhs.w + self.z * rhs.x,
-      self.w * rhs.z + self.x * rhs.y - self.y * rhs.x + self.z * rhs.w,
-      self.w * rhs.w - self.x * rhs.x - self.y * rhs.y - self.z * rhs.z)
+    ax, ay, az, aw = self.x, self.y, self.z, self.w
+    bx, by, bz, bw = rhs.x, rhs.y, rhs.z, rhs.w
+    return Quaternion._new(
+      aw * bx + ax * bw + ay * bz - az * by,
+      aw * by - ax * bz + ay * bw + az * bx,
+      aw * bz + ax * by - ay * bx + az * bw,
+      aw * bw - ax * bx - ay * by - az * bz)
 
   def __iter__(self):
     return iter((self.x, self.y, self.z, self.w))
@@ -179,7 +234,7 @@ class Quaternion(object):
     Returns this Quaternion's conjugate.
     """
 
-    return Quaternion(-self.x, -self.y, -self.z, self.w)
+    return Quaternion._new(-self.x, -self.y, -self.z, self.w)
 
   def __getitem__(self, index):
     return (self.x, self.y, self.z, self.w)[index]
@@ -189,14 +244,15 @@ class Quaternion(object):
     Returns a shallow copy of the quaternion.
     """
 
-    return Quaternion(self.x, self.y, self.z, self.w)
+    return Quaternion._new(self.x, self.y, self.z, self.w)
 
   def magnitude(self):
     """
     Returns the magnitude of the quaternion.
     """
 
-    return math.sqrt(self.x ** 2 + self.y ** 2 + self.z ** 2 + self.w ** 2)
+    x, y, z, w = self.x, self.y, self.z, self.w
+    return math.sqrt(x * x + y * y + z * z + w * w)
 
   def normalized(self):
     """
@@ -204,10 +260,9 @@ class Quaternion(object):
     as this one.
     """
 
-    magnitude = self.magnitude()
-    return Quaternion(
-      self.x / magnitude, self.y / magnitude,
-      self.z / magnitude, self.w / magnitude)
+    x, y, z, w = self.x, self.y, self.z, self.w
+    scale = 1.0 / math.sqrt(x * x + y * y + z * z + w * w)
+    return Quaternion._new(x * scale, y * scale, z * scale, w * scale)
 
   conjugate = __invert__
 
@@ -219,8 +274,16 @@ class Quaternion(object):
     :return: object of type of *vec*
     """
 
-    qvec = self * Quaternion(vec.x, vec.y, vec.z, 0) * ~self
-    return type(vec)(qvec.x, qvec.y, qvec.z)
+    # Expanded form of `self * Quaternion(vec.x, vec.y, vec.z, 0) * ~self`.
+    x, y, z, w = self.x, self.y, self.z, self.w
+    vx, vy, vz = vec.x, vec.y, vec.z
+    xx, yy, zz, ww = x * x, y * y, z * z, w * w
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+    return type(vec)(
+      (ww + xx - yy - zz) * vx + 2 * (xy - wz) * vy + 2 * (xz + wy) * vz,
+      2 * (xy + wz) * vx + (ww - xx + yy - zz) * vy + 2 * (yz - wx) * vz,
+      2 * (xz - wy) * vx + 2 * (yz + wx) * vy + (ww - xx - yy + zz) * vz)
 
   # Reference:
   # http://answers.unity3d.com/questions/416169/finding-pitchrollyaw-from-quaternions.html
@@ -251,9 +314,10 @@ class Quaternion(object):
     """ Calculates the Roll, Pitch and Yaw of the Quaternion. """
 
     x, y, z, w = self.x, self.y, self.z, self.w
-    roll = math.atan2(2*y*w - 2*x*z, 1 - 2*y*y - 2*z*z)
-    pitch = math.atan2(2*x*w - 2*y*z, 1 - 2*x*x - 2*z*z)
-    yaw = math.asin(2*x*y + 2*z*w)
+    zz = z*z
+    roll = math.atan2(2*(y*w - x*z), 1 - 2*(y*y + zz))
+    pitch = math.atan2(2*(x*w - y*z), 1 - 2*(x*x + zz))
+    yaw = math.asin(2*(x*y + z*w))
     return (roll, pitch, yaw)
 
   @staticmethod
@@ -273,30 +337,37 @@ class Quaternion(object):
 
     source = Vector(source.x, source.y, source.z)
     dest = Vector(dest.x, dest.y, dest.z)
-    cross = source.cross(dest)
-    cos_theta = source.dot(dest)
-
-    # Return identity if the vectors are the same direction.
-    if cos_theta >= 1.0:
-      return Quaternion.identity()
 
-    # Product of the square of the magnitudes.
-    k = math.sqrt(source.dot(source), dest.dot(dest))
+    # Product of the magnitudes.
+    k = math.sqrt(source.dot(source) * dest.dot(dest))
 
     # Return identity in the degenerate case.
     if k <= 0.0:
       return Quaternion.identity()
 
-    # Special handling for vectors facing opposite directions.
-    if cos_theta / k <= -1:
-      x_axis = Vector(1, 0, 0)
-      y_axis = Vector(0, 1, 1)
-      if abs(source.dot(x_ais)) < 1.0:
-        cross = source.cross(x_axis)
+    # Return identity if the vectors are the same direction.
+    cos_theta = source.dot(dest)
+    if cos_theta >= k:
+      return Quaternion.identity()
+
+    w = k + cos_theta
+    if w > k * 1e-12:
+      cross = source.cross(dest)
+    else:
+      # The vectors face opposite directions, rotate by 180 degrees around
+      # an axis perpendicular to *source*. Use the coordinate axis that is
+      # the least aligned with *source* to compute it.
+      ax, ay, az = abs(source.x), abs(source.y), abs(source.z)
+      if az < ax and az < ay:
+        axis = Vector(0, 0, 1)
+      elif ax <= ay:
+        axis = Vector(1, 0, 0)
       else:
-        cross = source.cross(y_axis)
+        axis = Vector(0, 1, 0)
+      cross = source.cross(axis)
+      w = 0.0
 
-    return Quaternion(cross.x, cross.y, cross.z, k + cos_theta)
+    return Quaternion(cross.x, cross.y, cross.z, w).normalized()
 
   @staticmethod
   def from_axis_angle(axis, angle):
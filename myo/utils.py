@@ -29,20 +29,25 @@ class TimeInterval(object):
   A helper class to keep track of a time interval.
   """
 
+  __slots__ = ('value', 'value_on_reset', 'clock', 'start')
+
   def __init__(self, value, value_on_reset=None, clock=None):
     self.value = value
     self.value_on_reset = value_on_reset
     self.clock = clock or time.perf_counter
-    self.start = self.clock
+    self.start = self.clock()
 
-  def check(self):
+  def check(self, now=None):
     """
-    Returns #True if the time interval has passed.
+    Returns #True if the time interval has passed. *now* can be a time
+    that was already read from the #clock.
     """
 
     if self.value is None:
       return True
-    return (self.clock() - self.start) >= self.value
+    if now is None:
+      now = self.clock()
+    return (now - self.start) >= self.value
 
   def reset(self, value=None):
     """
@@ -60,32 +65,40 @@ class TimeInterval(object):
     Combination of #check() and #reset().
     """
 
-    if self.check():
-      self.reset(value)
+    now = self.clock()
+    if self.check(now):
+      self.reset(now if value is None else value)
       return True
     return False
 
 
 class TimeoutManager(TimeInterval):
 
-  def check(self):
+  __slots__ = ()
+
+  def check(self, now=None):
     """
     Returns #True if the timeout is exceeded.
     """
 
     if self.value is None:
       return False
-    return (self.clock() - self.start) >= self.value
+    if now is None:
+      now = self.clock()
+    return (now - self.start) >= self.value
 
-  def remainder(self, max_value=None):
+  def remainder(self, max_value=None, now=None):
     """
     Returns the time remaining for the timeout, or *max_value* if that
-    remainder is larger.
+    remainder is larger. Like with #check(), *now* can be a time that was
+    already read from the #clock.
     """
 
     if self.value is None:
       return max_value
-    remainder = self.value - (self.clock() - self.start)
+    if now is None:
+      now = self.clock()
+    remainder = self.value - (now - self.start)
     if remainder < 0.0:
       return 0.0
     elif max_value is not None and remainder > max_value:
@@ -17,7 +17,6 @@ else:
 
 requirements = [
   'cffi >=1.11.5,<2.0.0',
-  'six >=1.11.0,<2.0.0',
 ]
 
 setuptools.setup(
@@ -0,0 +1,211 @@
+import array
+import threading
+import time
+import warnings
+
+import pytest
+
+from myo import (ApiDeviceListener, Arm, DeviceListener, EventType, Pose,
+                 XDirection)
+from myo._device_listener import DeviceProxy
+from myo.math import Quaternion, Vector
+
+
+class StubDevice(object):
+
+  def __init__(self, handle):
+    self.handle = handle
+
+
+class StubEvent(object):
+  """
+  Stands in for an #myo.Event, keyword arguments become its attributes.
+  """
+
+  def __init__(self, type=EventType.emg, timestamp=0, emg=(0,) * 8, **kwargs):
+    self.type = type
+    self.timestamp = timestamp
+    self._emg = tuple(emg)
+    self.__dict__.update(kwargs)
+
+  def _read_emg(self):
+    return self._emg
+
+
+def paired(device, timestamp=0):
+  return StubEvent(EventType.paired, timestamp, device=device,
+                   firmware_version=(1, 5, 1970, 2), mac_address=None)
+
+
+def push(listener, device, count):
+  for timestamp in range(count):
+    emg = [(timestamp + i) % 128 for i in range(8)]
+    listener._update_emg(device, StubEvent(timestamp=timestamp, emg=emg))
+
+
+def expected_emg(timestamps):
+  return array.array('b', [(t + i) % 128 for t in timestamps for i in range(8)])
+
+
+def test_emg_window_wraps_around():
+  listener = ApiDeviceListener(emg_buffer_size=4)
+  device = DeviceProxy(None, 0, None, None, emg_buffer_size=4)
+  push(listener, device, 6)
+
+  timestamps, emg = device.emg_window()
+  assert timestamps == array.array('Q', [2, 3, 4, 5])
+  assert emg == expected_emg([2, 3, 4, 5])
+
+  timestamps, emg = device.emg_window(3)
+  assert timestamps == array.array('Q', [3, 4, 5])
+  assert emg == expected_emg([3, 4, 5])
+
+  assert device.emg_window(0) == (array.array('Q'), array.array('b'))
+  assert device.emg == list(expected_emg([5]))
+
+
+def test_emg_window_before_wrapping():
+  listener = ApiDeviceListener(emg_buffer_size=4)
+  device = DeviceProxy(None, 0, None, None, emg_buffer_size=4)
+  push(listener, device, 2)
+
+  timestamps, emg = device.emg_window(10)
+  assert timestamps == array.array('Q', [0, 1])
+  assert emg == expected_emg([0, 1])
+
+
+def test_emg_buffer_disabled():
+  listener = ApiDeviceListener(emg_buffer_size=0)
+  device = DeviceProxy(None, 0, None, None, emg_buffer_size=0)
+  push(listener, device, 3)
+  assert device.emg_window() == (array.array('Q'), array.array('b'))
+  assert device.emg == list(expected_emg([2]))
+
+
+def test_emg_buffer_size_negative():
+  with pytest.raises(ValueError):
+    ApiDeviceListener(emg_buffer_size=-1)
+
+
+def test_update_methods_can_be_overridden():
+  poses = []
+
+  class Listener(ApiDeviceListener):
+    def _update_pose(self, device, event):
+      poses.append(event.pose)
+      super(Listener, self)._update_pose(device, event)
+
+  listener = Listener()
+  device = StubDevice(1)
+  listener.on_event(paired(device))
+  listener.on_event(StubEvent(EventType.pose, device=device, pose=Pose.fist))
+  assert poses == [Pose.fist]
+  assert listener.devices[0].pose == Pose.fist
+
+
+def test_device_lifecycle():
+  listener = ApiDeviceListener()
+  device = StubDevice(1)
+  imu = (Quaternion(0, 0, 0, 1), Vector(1, 2, 3), Vector(4, 5, 6))
+
+  listener.on_event(paired(device, timestamp=1))
+  [proxy] = listener.devices
+  assert listener.connected_devices == []
+  assert not proxy.connected
+
+  listener.on_event(StubEvent(EventType.connected, 2, device=device))
+  assert listener.connected_devices == [proxy]
+  assert proxy.connected and proxy.connect_time == 2
+
+  listener.on_event(StubEvent(EventType.orientation, 3, device=device, imu=imu))
+  listener.on_event(StubEvent(EventType.emg, 4, device=device, emg=range(8)))
+  listener.on_event(StubEvent(EventType.pose, 5, device=device, pose=Pose.fist))
+  listener.on_event(StubEvent(EventType.arm_synced, 6, device=device,
+                              arm=Arm.left, x_direction=XDirection.toward_elbow))
+  assert proxy.imu is imu
+  assert proxy.orientation is imu[0]
+  assert proxy.orientation_update_index == 1
+  assert proxy.emg == list(range(8))
+  assert proxy.pose == Pose.fist
+  assert (proxy.arm, proxy.x_direction) == (Arm.left, XDirection.toward_elbow)
+
+  listener.on_event(StubEvent(EventType.disconnected, 7, device=device))
+  assert listener.connected_devices == []
+  assert not proxy.connected and proxy.disconnect_time == 7
+
+  # Reconnecting clears the disconnect time again.
+  listener.on_event(StubEvent(EventType.connected, 8, device=device))
+  assert listener.connected_devices == [proxy]
+  assert proxy.connected and proxy.disconnect_time is None
+
+  listener.on_event(StubEvent(EventType.unpaired, 9, device=device))
+  assert listener.devices == []
+  assert listener.connected_devices == []
+  assert proxy.unpair_time == 9
+
+
+def test_events_of_unknown_devices_are_dropped():
+  listener = ApiDeviceListener()
+  listener.on_event(paired(StubDevice(1)))
+  unknown = StubDevice(2)
+  for event in [StubEvent(EventType.connected, device=unknown),
+                StubEvent(EventType.emg, device=unknown),
+                StubEvent(EventType.pose, device=unknown, pose=Pose.fist),
+                StubEvent(EventType.unpaired, device=unknown)]:
+    assert listener.on_event(event) is None
+  [proxy] = listener.devices
+  assert listener.connected_devices == []
+  assert proxy.emg is None and proxy.pose == Pose.rest
+
+
+def test_wait_for_single_device_already_connected():
+  listener = ApiDeviceListener()
+  device = StubDevice(1)
+  listener.on_event(paired(device))
+  listener.on_event(StubEvent(EventType.connected, device=device))
+  assert listener.wait_for_single_device(timeout=0) is listener.devices[0]
+
+
+def test_wait_for_single_device_connect_during_wait():
+  listener = ApiDeviceListener()
+  device = StubDevice(1)
+  listener.on_event(paired(device))
+
+  def connect():
+    time.sleep(0.05)
+    listener.on_event(StubEvent(EventType.connected, device=device))
+
+  thread = threading.Thread(target=connect)
+  start = time.monotonic()
+  thread.start()
+  try:
+    # The connect must wake up the waiting thread before the interval ends.
+    result = listener.wait_for_single_device(timeout=5, interval=2)
+  finally:
+    thread.join()
+  assert result is listener.devices[0]
+  assert time.monotonic() - start < 1
+
+
+def test_wait_for_single_device_timeout():
+  listener = ApiDeviceListener()
+  listener.on_event(paired(StubDevice(1)))  # Paired, but not connected.
+  start = time.monotonic()
+  assert listener.wait_for_single_device(timeout=0.05) is None
+  assert 0.05 <= time.monotonic() - start < 1
+
+
+def test_unhandled_event_warns_once_per_listener_class():
+  class ListenerA(DeviceListener):
+    on_pose = None
+
+  class ListenerB(DeviceListener):
+    on_pose = None
+
+  event = StubEvent(EventType.pose)
+  for listener_class in (ListenerA, ListenerB):
+    with pytest.warns(UserWarning):
+      assert listener_class().on_event(event) is True
+    with warnings.catch_warnings():
+      warnings.simplefilter('error')
+      listener_class().on_event(event)
@@ -0,0 +1,179 @@
+import gc
+
+import pytest
+
+import myo
+from myo import _ffi
+
+
+class StubLibmyo(object):
+  """
+  A minimal stand-in for the libmyo library. #libmyo_run() dispatches the
+  event types in #events and reports an error if #fail is set.
+  """
+
+  def __init__(self):
+    self.events = []
+    self.fail = False
+
+  def libmyo_init_hub(self, hub, application_identifier, error):
+    hub[0] = _ffi.ffi.cast('void*', 1)
+    return 0
+
+  def libmyo_shutdown_hub(self, hub, error):
+    return 0
+
+  def libmyo_set_locking_policy(self, hub, policy, error):
+    return 0
+
+  def libmyo_run(self, hub, duration_ms, handler, userdata, error):
+    self.userdata = userdata
+    for index in range(len(self.events)):
+      event = _ffi.ffi.cast('libmyo_event_t', index + 1)
+      if handler(userdata, event) == _ffi._STOP:
+        break
+    if self.fail:
+      error[0] = _ffi.ffi.cast('libmyo_error_details_t', 1)
+    return 0
+
+  def _event(self, event):
+    return self.events[int(_ffi.ffi.cast('uintptr_t', event)) - 1]
+
+  def libmyo_event_get_type(self, event):
+    return self._event(event)['type']
+
+  def libmyo_event_get_timestamp(self, event):
+    return self._event(event)['timestamp']
+
+  def libmyo_event_get_emg(self, event, index):
+    return self._event(event)['emg'][index]
+
+  def libmyo_error_kind(self, error):
+    return int(myo.Result.error)
+
+  def libmyo_error_cstring(self, error):
+    return _ffi.ffi.new('char[]', b'stub error')
+
+  def libmyo_free_error_details(self, error):
+    pass
+
+  def libmyo_event_get_orientation(self, event, index):
+    return self._event(event)['orientation'][index]
+
+  def libmyo_event_get_accelerometer(self, event, index):
+    return self._event(event)['acceleration'][index]
+
+  def libmyo_event_get_gyroscope(self, event, index):
+    return self._event(event)['gyroscope'][index]
+
+  libmyo_event_get_myo = libmyo_event_get_mac_address = None
+  libmyo_event_get_pose = None
+
+
+@pytest.fixture
+def lib(monkeypatch):
+  lib = StubLibmyo()
+  monkeypatch.setattr(_ffi, 'libmyo', lib)
+  # Same as _ffi._bind_symbols(lib), but undone after the test.
+  for name in dir(_ffi):
+    if name.startswith('_event_get_'):
+      monkeypatch.setattr(_ffi, name, getattr(lib, 'libmyo' + name))
+  yield lib
+  # Hubs call into libmyo when they are deleted, collect them before the
+  # stub is removed again.
+  gc.collect()
+
+
+def test_handler_exception_does_not_leak_into_next_run(lib):
+  hub = myo.Hub()
+  lib.events = [{'type': int(myo.EventType.paired)}]
+
+  def fail(event):
+    raise ValueError('from run 1')
+
+  # libmyo's error takes precedence over the handler's exception.
+  lib.fail = True
+  with pytest.raises(myo.ResultError):
+    hub.run(fail, 100)
+
+  lib.fail = False
+  assert hub.run(lambda event: None, 100) is True
+
+
+def test_run_capture(lib):
+  hub = myo.Hub()
+  lib.events = [
+    {'type': int(myo.EventType.emg), 'timestamp': 1, 'emg': range(8)},
+    {'type': int(myo.EventType.pose), 'timestamp': 2},
+    {'type': int(myo.EventType.emg), 'timestamp': 3, 'emg': range(-8, 0)},
+  ]
+  timestamps, emg = hub.run_capture(100)
+  assert list(timestamps) == [1, 3]
+  assert list(emg) == list(range(8)) + list(range(-8, 0))
+
+
+def test_run_capture_exception(lib):
+  hub = myo.Hub()
+  lib.events = [
+    {'type': int(myo.EventType.emg), 'timestamp': 1, 'emg': range(8)},
+    {'type': int(myo.EventType.emg), 'timestamp': 2},  # Missing 'emg'.
+    {'type': int(myo.EventType.emg), 'timestamp': 3, 'emg': range(8)},
+  ]
+  with pytest.raises(KeyError):
+    hub.run_capture(100)
+  assert hub.run(lambda event: None, 100) is True
+
+
+def test_reused_event_does_not_keep_cached_values(lib):
+  hub = myo.Hub()
+  lib.events = [
+    {'type': int(myo.EventType.orientation), 'timestamp': 1,
+     'orientation': (0, 0, 0, 1), 'acceleration': (1, 2, 3),
+     'gyroscope': (4, 5, 6)},
+    {'type': int(myo.EventType.orientation), 'timestamp': 2,
+     'orientation': (1, 0, 0, 0), 'acceleration': (7, 8, 9),
+     'gyroscope': (10, 11, 12)},
+    {'type': int(myo.EventType.emg), 'timestamp': 3, 'emg': range(8)},
+    {'type': int(myo.EventType.emg), 'timestamp': 4, 'emg': range(-8, 0)},
+  ]
+
+  seen = []
+  def handler(event):
+    # Read twice, the second read comes from the per-event cache.
+    for _ in range(2):
+      if event.type == myo.EventType.orientation:
+        orientation, acceleration, gyroscope = event.imu
+        data = (tuple(orientation), tuple(acceleration), tuple(gyroscope),
+                tuple(event.orientation))
+      else:
+        data = (event.emg, event.emg_bytes)
+      seen.append((event.timestamp, data))
+
+  assert hub.run(handler, 100) is True
+  assert seen[0::2] == seen[1::2]
+  assert seen[0::2] == [
+    (1, ((0, 0, 0, 1), (1, 2, 3), (4, 5, 6), (0, 0, 0, 1))),
+    (2, ((1, 0, 0, 0), (7, 8, 9), (10, 11, 12), (1, 0, 0, 0))),
+    (3, (list(range(8)), bytes(range(8)))),
+    (4, (list(range(-8, 0)), bytes(x & 0xff for x in range(-8, 0)))),
+  ]
+
+
+def test_native_handler(lib):
+  hub = myo.Hub()
+  lib.events = [{'type': int(myo.EventType.paired)},
+                {'type': int(myo.EventType.connected)}]
+
+  types = []
+  def handler(userdata, event):
+    types.append(_ffi._event_get_type(event))
+    return _ffi._CONTINUE
+
+  native_handler = _ffi.ffi.callback(_ffi._handler_t, handler)
+  assert hub.run(native_handler, 100) is True
+  assert lib.userdata == _ffi.ffi.NULL
+  assert types == [int(myo.EventType.paired), int(myo.EventType.connected)]
+
+  lib.fail = True
+  with pytest.raises(myo.ResultError):
+    hub.run(native_handler, 100)
@@ -0,0 +1,45 @@
+import pytest
+
+from myo.macaddr import MacAddress, decode
+
+
+def test_mac_address_from_string():
+  assert MacAddress('aa:bb:cc:dd:ee:ff').value == 0xaabbccddeeff
+  assert MacAddress(b'AA:BB:CC:DD:EE:FF').value == 0xaabbccddeeff
+  assert str(MacAddress(0xaabbccddeeff)) == 'AA:BB:CC:DD:EE:FF'
+
+
+def test_mac_address_invalid_type():
+  with pytest.raises(TypeError):
+    MacAddress(1.0)
+  with pytest.raises(TypeError):
+    MacAddress(None)
+
+
+@pytest.mark.parametrize('value', [
+  b'-00000000001', b' 0000000001 ', b'00_000000001', b'00:11:22:33:44',
+  b'00:11:22:33:44:5g', b'00:11:22:33:44:55:66',
+])
+def test_decode_invalid(value):
+  with pytest.raises(ValueError):
+    decode(value)
+
+
+def test_decode():
+  assert decode(b'00:11:22:33:44:55') == 0x001122334455
+  assert decode(b'aabbccddeeff') == 0xaabbccddeeff
+
+
+def test_mac_address_equality():
+  a = MacAddress('00:11:22:33:44:55')
+  b = MacAddress(0x001122334455)
+  assert a == b and not a != b
+  assert hash(a) == hash(b)
+  assert a != MacAddress(0x001122334456)
+
+  # Only equal to other MacAddress objects, not to the int or str forms.
+  assert a != 0x001122334455
+  assert a != '00:11:22:33:44:55'
+
+  assert {a: 'device'}[b] == 'device'
+  assert len({a, b}) == 1
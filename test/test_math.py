@@ -0,0 +1,42 @@
+import random
+from fractions import Fraction
+
+from myo.math import Quaternion, Vector
+
+
+def assert_vector_close(a, b):
+  assert all(abs(x - y) < 1e-9 for x, y in zip(a, b)), (a, b)
+
+
+def test_rotation_of():
+  random.seed(0)
+  for _ in range(100):
+    source = Vector(*[random.uniform(-2, 2) for _ in range(3)])
+    dest = Vector(*[random.uniform(-2, 2) for _ in range(3)])
+    rot = Quaternion.rotation_of(source, dest)
+    assert abs(rot.magnitude() - 1.0) < 1e-9
+    assert_vector_close(rot.rotate(source.normalized()), dest.normalized())
+
+
+def test_rotation_of_parallel():
+  rot = Quaternion.rotation_of(Vector(2, 0, 0), Vector(1, 0, 0))
+  assert tuple(rot) == (0, 0, 0, 1)
+  rot = Quaternion.rotation_of(Vector(0, 0, 0), Vector(1, 0, 0))
+  assert tuple(rot) == (0, 0, 0, 1)
+
+
+def test_rotation_of_opposite():
+  for source in [Vector(1, 0, 0), Vector(0, 3, 0), Vector(0, 0, -1),
+                 Vector(1, 1, 1)]:
+    rot = Quaternion.rotation_of(source, ~source)
+    assert abs(rot.magnitude() - 1.0) < 1e-9
+    assert_vector_close(rot.rotate(source), ~source)
+
+
+def test_vector_scalar_operators_store_floats():
+  vec = Vector(1, 2, 3)
+  for scalar in [2, 2.0, True, Fraction(1, 2)]:
+    for result in [vec * scalar, vec + scalar, vec - scalar]:
+      assert all(type(value) is float for value in result), (scalar, result)
+  assert tuple(vec * Fraction(1, 2)) == (0.5, 1.0, 1.5)
+  assert vec * Vector(1, 1, 1) == 6.0
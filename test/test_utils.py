@@ -0,0 +1,40 @@
+from myo.utils import TimeInterval, TimeoutManager
+
+
+class FakeClock(object):
+
+  def __init__(self):
+    self.time = 10.0
+
+  def __call__(self):
+    return self.time
+
+
+def test_time_interval_check_before_reset():
+  clock = FakeClock()
+  interval = TimeInterval(1.0, clock=clock)
+  assert interval.check() is False
+  clock.time += 1.0
+  assert interval.check() is True
+
+
+def test_time_interval_check_and_reset():
+  clock = FakeClock()
+  interval = TimeInterval(1.0, clock=clock)
+  assert interval.check_and_reset() is False
+  clock.time += 1.5
+  assert interval.check_and_reset() is True
+  assert interval.start == clock.time
+  assert interval.check_and_reset() is False
+
+
+def test_timeout_manager():
+  clock = FakeClock()
+  timeout = TimeoutManager(2.0, clock=clock)
+  assert timeout.check() is False
+  assert timeout.remainder() == 2.0
+  assert timeout.remainder(0.5) == 0.5
+  clock.time += 3.0
+  assert timeout.check() is True
+  assert timeout.remainder() == 0.0
+  assert TimeoutManager(None, clock=clock).check() is False